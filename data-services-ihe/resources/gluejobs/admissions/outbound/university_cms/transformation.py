@@ -6,9 +6,9 @@ The SFTP connector initiates the transfer from S3 to the target location at Univ
 """
 
 from datetime import datetime
-import boto3
+import hashlib
+import importlib.metadata
 import json
-import pkg_resources
 from data_transformer.factory.transformation_context import TransformationContext
 from data_transformer.factory.transformer_factory import DataTransformerFactory
 from pyspark.sql.functions import sys, SparkContext
@@ -17,18 +17,6 @@ from awsglue.context import GlueContext  # pylint: disable=E0401
 from awsglue.job import Job  # pylint: disable=E0401
 from awsglue.utils import getResolvedOptions
 
-s3 = boto3.client(service_name="s3", region_name="us-east-1")
-
-glue_client = boto3.client(
-    service_name="glue",
-    region_name="us-east-1",
-    endpoint_url="https://glue.us-east-1.amazonaws.com",
-)
-
-ssm = boto3.client("ssm", region_name="us-east-1")
-
-dynamodb = boto3.client("dynamodb", region_name="us-east-1")
-
 ### Initialize Spark & Glue Context#####
 spark_context = SparkContext()
 glue_context = GlueContext(spark_context)
@@ -36,12 +24,28 @@ spark = glue_context.spark_session
 ## Initialize logger instance
 logger = glue_context.get_logger()
 
-# Log installed packages
-packages = [
-    f"{pkg.project_name}=={pkg.version}"
-    for pkg in sorted(pkg_resources.working_set, key=lambda x: x.project_name.lower())
-]
-logger.info(f"Installed packages: {', '.join(packages)}")
+# Log a digest of installed packages only when requested with
+# --log_installed_packages true, scanning every installed distribution slows
+# down job startup. The digest keeps the log line small and still changes
+# whenever a package is added, removed or upgraded.
+log_installed_packages = False
+if "--log_installed_packages" in sys.argv:
+    # Glue job arguments always carry a value, only "true" turns the scan on
+    log_installed_packages = (
+        getResolvedOptions(sys.argv, ["log_installed_packages"])[
+            "log_installed_packages"
+        ].lower()
+        == "true"
+    )
+if log_installed_packages:
+    packages = sorted(
+        f"{dist.metadata['Name']}=={dist.version}"
+        for dist in importlib.metadata.distributions()
+    )
+    package_set_sha256 = hashlib.sha256("\n".join(packages).encode()).hexdigest()
+    logger.info(
+        f"Installed packages: {len(packages)} package_set_sha256={package_set_sha256}"
+    )
 
 
 logger.info("Starting transformation job......")
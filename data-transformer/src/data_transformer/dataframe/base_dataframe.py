@@ -3,7 +3,6 @@
 from typing import List
 
 import pandas as pd
-from flatten_json import flatten, unflatten
 
 from data_transformer.dataframe.dataframe_loader import DataframeLoader
 
@@ -42,10 +41,74 @@ class BaseDataframe:
         :return: A flattened JSON dictionary using '.' as separator
         :rtype: dict
         """
-        return flatten(jdata, separator=".")
+        flattened = {}
+        # Walk the document iteratively so deep nesting does not recurse and
+        # each key path is only joined once on the way down
+        stack = [("", jdata)]
+        while stack:
+            prefix, value = stack.pop()
+            if isinstance(value, dict):
+                items = value.items()
+            elif isinstance(value, (list, tuple, set)):
+                items = enumerate(value)
+            else:
+                flattened[prefix] = value
+                continue
+            if not value and prefix:
+                # keep empty containers, same as flatten_json
+                flattened[prefix] = value
+                continue
+            # push in reverse so keys come out in document order
+            for key, child in reversed(list(items)):
+                stack.append((f"{prefix}.{key}" if prefix else str(key), child))
+        return flattened
 
     @staticmethod
-    def nested_json_to_df(jdata: dict, index: str = "pkhId") -> pd.DataFrame:
+    def makeunflat(flat_data: dict) -> dict:
+        """Use this method to unflatten JSON dictionaries created by makeflat().
+
+        Keys are split on the '.' separator in a single pass. List indices
+        are restored as string dictionary keys, and a value whose key is the
+        parent of another key is dropped, same as flatten_json.unflatten.
+
+        :param flat_data: A flattened JSON dictionary using '.' as separator
+        :type flat_data: dict
+        :return: A nested JSON dictionary
+        :rtype: dict
+        """
+        unflattened = {}
+        for key, value in flat_data.items():
+            *parents, leaf = key.split(".")
+            node = unflattened
+            for part in parents:
+                child = node.get(part)
+                if not isinstance(child, dict):
+                    child = node[part] = {}
+                node = child
+            if not isinstance(node.get(leaf), dict):
+                node[leaf] = value
+        return unflattened
+
+    @staticmethod
+    def makeflat_many(records: List[dict]) -> pd.DataFrame:
+        """Flatten a batch of nested JSON dictionaries into a single DataFrame.
+
+        Prefer this over calling makeflat() per record and concatenating the
+        results, since the DataFrame is built once from all flattened rows.
+
+        :param records: JSON dictionaries to flatten
+        :type records: List[dict]
+        :return: A Pandas DataFrame with one row per record using '.' as column separator
+        :rtype: pd.DataFrame
+        """
+        return pd.DataFrame.from_records(
+            [BaseDataframe.makeflat(record) for record in records]
+        )
+
+    @staticmethod
+    def nested_json_to_df(
+        jdata: dict | List[dict], index: str = "pkhId"
+    ) -> pd.DataFrame:
         """Use this method to create a Pandas DataFrame from nested JSON data.
 
         This method assumes that the data is indexed by pkhId. If it's not, use
@@ -60,13 +123,21 @@ class BaseDataframe:
         back to a Pydantic model is desired, use the flat_df_to_unflat_json
         method, and regroup your lists as necessary.
 
-        :param jdata: JSON dictionary with nested lists of models, e.g. lists of Email or Phone models
-        :type jdata: dict
+        A list of documents is flattened into one DataFrame in a single pass,
+        indexed by the values of the index field when it is present.
+
+        :param jdata: JSON dictionary (or list of dictionaries) with nested lists of models, e.g. lists of Email or Phone models
+        :type jdata: dict | List[dict]
         :param index: The string field name to use for the DataFrame index
         :type index: str
         :return: A Pandas DataFrame composed of flattened JSON data
         :rtype: pd.DataFrame
         """
+        if isinstance(jdata, list):
+            df = BaseDataframe.makeflat_many(jdata)
+            if index in df.columns:
+                df.index = df[index]
+            return df
         return pd.DataFrame(BaseDataframe.makeflat(jdata), index=[index])
 
     @staticmethod
@@ -82,4 +153,15 @@ class BaseDataframe:
         This is a companion function to the makeflat() and nested_json_to_df()
         methods.
         """
-        return unflatten(df.to_dict(orient="records")[0], separator=".")
+        return BaseDataframe.makeunflat(df.to_dict(orient="records")[0])
+
+    @staticmethod
+    def flat_df_to_unflat_json_many(df: pd.DataFrame) -> List[dict]:
+        """Convert every row of a flattened DataFrame back to unflattened JSON.
+
+        Batch companion of flat_df_to_unflat_json() for DataFrames created
+        with makeflat_many() or nested_json_to_df() from a list of documents.
+        """
+        return [
+            BaseDataframe.makeunflat(record) for record in df.to_dict(orient="records")
+        ]
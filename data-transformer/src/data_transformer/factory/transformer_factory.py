@@ -1,6 +1,7 @@
 """Transformer factory"""
 from .transformation_context import TransformationContext
 from ..transformer.base_transformer import BaseDataTransformer
+from ..dataframe.dataframe_loader import DataframeLoader
 from ..dataframe.university_cms_dataframe import (
     UniversityCMSInstitutionApplicationDataframe,
 )
@@ -8,6 +9,15 @@ from ..transformer.pkh_enterprise.university_cms_transcript_transformer import (
     UniversityCMSTranscriptDataTransformer,
 )
 
+# (data transformer type, tenant code) -> (dataframe class, transformer class)
+DATA_TRANSFORMER_REGISTRY = {
+    ("InstitutionTranscript", "UNIVERSITY"): (
+        UniversityCMSInstitutionApplicationDataframe,
+        UniversityCMSTranscriptDataTransformer,
+    ),
+}
+
+
 class DataTransformerFactory:
     """Data transformer factory"""
 
@@ -25,25 +35,11 @@ class DataTransformerFactory:
         :rtype: object
         """
         logger = transformation_context.get_logger()
-        dataframe_loader = DataframeLoader(transformation_context)
-x
-        if data_transformer_type == "InstitutionApplication":
-            if "UNIVERSITY" == transformation_context.tenant_code:
-                application_dataframe = UniversityCMSInstitutionApplicationDataframe(
-                    dataframe_loader
-                )
-                return UniversityCMSInstitutionApplicationDataTransformer(
-                    application_dataframe, transformation_context
-                )
-        elif data_transformer_type == "InstitutionTranscript":
-            if "UNIVERSITY" == transformation_context.tenant_code:
-                application_dataframe = UniversityCMSInstitutionApplicationDataframe(
-                    dataframe_loader
-                )
-                return UniversityCMSTranscriptDataTransformer(
-                    application_dataframe, transformation_context
-                )
-        else:
+
+        dataframe_cls, transformer_cls = DATA_TRANSFORMER_REGISTRY.get(
+            (data_transformer_type, transformation_context.tenant_code), (None, None)
+        )
+        if transformer_cls is None:
             logger.error(
                 f"Unknown data transformer type: {data_transformer_type} for tenant {transformation_context.tenant_code}"
             )
@@ -51,3 +47,6 @@ x
                 "Data transformer not found returning base data transformer to client"
             )
             return BaseDataTransformer(transformation_context)
+
+        dataframe_loader = DataframeLoader(transformation_context)
+        return transformer_cls(dataframe_cls(dataframe_loader), transformation_context)
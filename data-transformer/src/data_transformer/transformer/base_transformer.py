@@ -1,16 +1,73 @@
 """Base class for transformer"""
 
 import json
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import TypeVar, Generic, List
+from datetime import datetime, timezone
+from typing import TypeVar, Generic, Iterator, List
 
 import boto3
+import orjson
+from botocore.config import Config
 
 from data_transformer.factory.transformation_context import TransformationContext
 from data_transformer.utils import config_utils
 
 T = TypeVar("T")
+# Kinesis PutRecords accepts at most 500 records and 5 MiB per request
+KINESIS_MAX_BATCH_SIZE = 500
+KINESIS_MAX_BATCH_BYTES = 5 * 1024 * 1024
+MAX_ATTEMPTS = 5
+# Shard throughput limits are per second, so retries back off for seconds
+RETRY_BASE_DELAY_SECONDS = 1
+
+
+# boto3 clients keyed by service name, shared process-wide by all transformers
+CLIENT_MAX_POOL_CONNECTIONS = 50
+_clients: dict = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(service_name: str):
+    """Get the process-wide boto3 client for a service, creating it on first use"""
+    with _clients_lock:
+        if service_name not in _clients:
+            _clients[service_name] = boto3.client(
+                service_name,
+                region_name="us-east-1",
+                config=Config(max_pool_connections=CLIENT_MAX_POOL_CONNECTIONS),
+            )
+        return _clients[service_name]
+
+
+def chunks(items: list, size: int) -> Iterator[list]:
+    """Yield successive slices of at most size items"""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def kinesis_batches(records: list[dict]) -> Iterator[list[dict]]:
+    """Yield PutRecords batches within both the record count and payload size caps
+
+    A record's size is its data plus its partition key.
+    """
+    batch = []
+    batch_bytes = 0
+    for record in records:
+        record_bytes = len(record["Data"]) + len(record["PartitionKey"].encode())
+        if batch and (
+            len(batch) == KINESIS_MAX_BATCH_SIZE
+            or batch_bytes + record_bytes > KINESIS_MAX_BATCH_BYTES
+        ):
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(record)
+        batch_bytes += record_bytes
+    if batch:
+        yield batch
 
 
 class TransformError(ABC, Generic[T]):
@@ -62,12 +119,24 @@ class TransformationResponse(ABC, Generic[T]):
         transformed_objects: T,
         transform_errors: [TransformError],
         total_count: int,
+        success_count: int | None = None,
+        failed_count: int | None = None,
     ):
+        """
+        :param success_count: number of transformed objects, when the producer
+            already knows it. Falls back to len(transformed_objects)
+        :param failed_count: number of transform errors, when the producer
+            already knows it. Falls back to len(transform_errors)
+        """
         self.transformed_objects = transformed_objects
         self.transform_errors = transform_errors
         self.total_count = total_count
-        self.failed_count = len(transform_errors)
-        self.success_count = len(transformed_objects)
+        self.failed_count = (
+            failed_count if failed_count is not None else len(transform_errors)
+        )
+        self.success_count = (
+            success_count if success_count is not None else len(transformed_objects)
+        )
 
     def __str__(self):
         return (
@@ -78,12 +147,12 @@ class TransformationResponse(ABC, Generic[T]):
 
     def errors_to_json(self) -> str:
         """Convert errors to JSON"""
-        if len(self.transform_errors) == 0:
+        if self.failed_count == 0:
             return ""
         errors = []
         for error in self.transform_errors:
             errors.append(error.to_json())
-        return json.dumps(errors)
+        return orjson.dumps(errors).decode("utf-8")
 
 
 class BaseDataTransformer(ABC):
@@ -92,12 +161,35 @@ class BaseDataTransformer(ABC):
     def __init__(self, context: TransformationContext):
         self.context = context
         self.logger = self.context.get_logger()
-        self.kinesis_client = boto3.client("kinesis", region_name="us-east-1")
+        self._ssm_parameters: dict[str, str] = {}
+        self._configs: dict[tuple[str, str], dict] = {}
+
+    @classmethod
+    def kinesis(cls):
+        """Get the kinesis client shared by all transformers, created on first use"""
+        return get_client("kinesis")
 
     @abstractmethod
     def transform(self) -> TransformationResponse[T]:
         """Generic transform method"""
 
+    def get_ssm_parameter(self, name: str) -> str:
+        """Get an SSM parameter, fetching it from SSM only on first use
+
+        Parameter values do not change during a job run, so they are cached
+        for the lifetime of the transformer.
+        """
+        if name not in self._ssm_parameters:
+            self._ssm_parameters[name] = config_utils.get_ssm_parameter(name)
+        return self._ssm_parameters[name]
+
+    def get_config(self, package: str, file_name: str) -> dict:
+        """Get a packaged config file, reading it only on first use"""
+        key = (package, file_name)
+        if key not in self._configs:
+            self._configs[key] = self.context.get_config(package, file_name)
+        return self._configs[key]
+
     def publish_errors(self, response: TransformationResponse):
         self.logger.info("Checking for transformation errors")
         if response and response.transform_errors:
@@ -121,38 +213,72 @@ class BaseDataTransformer(ABC):
             return
 
         try:
-            internal_kinesis_arn = config_utils.get_ssm_parameter(
+            internal_kinesis_arn = self.get_ssm_parameter(
                 f"/cdk/{self.context.env_name}/dps-data-service-baseline/internal-kinesis-stream-arn"
             )
             self.logger.info(
                 f"Publish error records to kinesis stream: {self.context.tenant_code} : {self.context.job_name} | stream arn : {internal_kinesis_arn} "
             )
-            for data in error_data_records:
+            # One timestamp for the whole batch of error records
+            published_time = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            records = []
+            for index, data in enumerate(error_data_records):
                 stream_data: any = {
                     "data_type": "error",
                     "tenant_code": self.context.tenant_code,
                     "detail_type": data.to_json(),
                     "job_name": self.context.job_name,
                     "job_run_id": self.context.correlation_id,
-                    "time": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "time": published_time,
                 }
-                data_w_newline = json.dumps(stream_data) + "\n"
-                data_w_newline = data_w_newline.encode("utf-8")
-
-                self.kinesis_client.put_record(
-                    StreamARN=internal_kinesis_arn,
-                    Data=data_w_newline,
-                    PartitionKey="error",
+                records.append(
+                    {
+                        "Data": orjson.dumps(stream_data) + b"\n",
+                        # Distinct keys spread the records across the stream's shards
+                        "PartitionKey": f"{self.context.correlation_id}-{index}",
+                    }
                 )
 
-                self.logger.info(
-                    f"Successfully streamed error data into kinesis Config Name: {data_w_newline}"
+            # Batches go out one at a time. Even with keys spread across shards,
+            # concurrent 500-record batches can exceed a shard's ~1000 records/s
+            # and would only be throttled into the retry path
+            streamed_count = 0
+            for batch in kinesis_batches(records):
+                self.__put_records(internal_kinesis_arn, batch)
+                streamed_count += len(batch)
+                self.logger.debug(
+                    f"Streamed batch of {len(batch)} error records into kinesis"
                 )
+            self.logger.info(
+                f"Successfully streamed {streamed_count} error records into kinesis"
+            )
         except Exception as exp:
             self.logger.error(
                 f"Tenant : {self.context.tenant_code} | {self.context.job_name} |"
                 f" Error putting error records into kinesis exception: {str(exp)}"
             )
 
+    def __put_records(self, stream_arn: str, records: list[dict]) -> None:
+        """Put a batch of records, retrying only the records Kinesis rejected"""
+        for attempt in range(MAX_ATTEMPTS):
+            response = self.kinesis().put_records(StreamARN=stream_arn, Records=records)
+            if response["FailedRecordCount"] == 0:
+                return
+            # Result entries line up with the request records by index
+            records = [
+                record
+                for record, result in zip(records, response["Records"])
+                if "ErrorCode" in result
+            ]
+            if attempt < MAX_ATTEMPTS - 1:
+                # Exponential backoff with jitter so retries do not land together
+                time.sleep(
+                    RETRY_BASE_DELAY_SECONDS * 2**attempt
+                    + random.uniform(0, RETRY_BASE_DELAY_SECONDS)
+                )
+        raise RuntimeError(
+            f"{len(records)} error records failed to be put into kinesis after {MAX_ATTEMPTS} attempts"
+        )
+
     def publish(self, success_payload: T) -> List[PublishResponse]:
         """Generic publish method"""
@@ -2,30 +2,45 @@
 
 from abc import abstractmethod
 from typing import List, TypeVar
+
+from botocore.exceptions import ClientError
+
+from ..factory.transformation_context import TransformationContext
 from ..utils import config_utils
 
 
-from .base_transformer import BaseDataTransformer
+from .base_transformer import BaseDataTransformer, chunks
 
 
 T = TypeVar("T")
 MAX_ATTEMPTS = 3
+# StartFileTransfer accepts at most 10 send file paths per request
+SFTP_MAX_FILES_PER_TRANSFER = 10
 
 
 class EgressBaseDataTransformer(BaseDataTransformer):
     """PKH Egress data transformer"""
 
+    def __init__(self, context: TransformationContext):
+        super().__init__(context)
+        self._transfer_client = None
+
     @abstractmethod
     def transform(self) -> List[T]:
         pass
 
-    def send_to_sftp_server(self, filename, s3_bucket_location) -> None:
-        """Send data to SFTP server"""
+    def send_to_sftp_server(
+        self, filenames: List[str] | str, s3_bucket_location
+    ) -> None:
+        """Send data files to SFTP server, up to 10 files per transfer request"""
+        # Callers written against the single-file signature pass one filename
+        if isinstance(filenames, str):
+            filenames = [filenames]
         # Get Connector Id, Role and S3 Bucket Location from SSM parameters
-        connector_id = config_utils.get_ssm_parameter(
+        connector_id = self.get_ssm_parameter(
             f"/services/{self.context.env_name}/{self.context.tenant_code.lower()}-sftp-connector-id"
         )
-        is_invocation_role = config_utils.get_ssm_parameter(
+        is_invocation_role = self.get_ssm_parameter(
             f"/services/{self.context.env_name}/{self.context.tenant_code.lower()}-sftp-connector-invocation-role-arn"
         )
         # This setup constructs the path based on naming standards for S3 bucket
@@ -35,28 +50,53 @@ class EgressBaseDataTransformer(BaseDataTransformer):
         self.logger.debug(f"is_invocation_role {is_invocation_role}")
         self.logger.debug(f"S3 Transfer Location  {s3_bucket_location}")
 
-        config_data = self.context.get_config(
+        config_data = self.get_config(
             f"data_transformer.configs.{self.context.env_name}",
             f"{self.context.tenant_code.lower()}-egress-config.json",
         )
         sftp_remote_path = config_data["sftpRemotePath"]
 
-        # Assume the role
-        session = config_utils.assume_role(
-            is_invocation_role, f"{self.context.tenant_code}-sftp-transfer-session"
-        )
-
         # Trigger AWS SFTP connector transfer from S3 bucket to SFTP server
-        transfer = session.client(service_name="transfer")
-        response = transfer.start_file_transfer(
-            ConnectorId=connector_id,
-            SendFilePaths=[f"/{s3_bucket_location}/{filename}"],
-            RemoteDirectoryPath=sftp_remote_path,
-        )
-        transfer_id = response["TransferId"]
-        self.logger.info(f"SFTP Transfer ID: {transfer_id}")
-        self.logger.info(f"SFTP Connector ID: {connector_id}")
-        self.logger.info(f"SFTP Bucket: {s3_bucket_location}")
-        self.logger.info(f"SFTP File: {filename}")
-        self.logger.info(f"SFTP Remote Path: {sftp_remote_path}")
-        self.logger.info(f"SFTP Response: {str(response)}")
+        for batch in chunks(filenames, SFTP_MAX_FILES_PER_TRANSFER):
+            response = self.__start_file_transfer(
+                is_invocation_role,
+                ConnectorId=connector_id,
+                SendFilePaths=[
+                    f"/{s3_bucket_location}/{filename}" for filename in batch
+                ],
+                RemoteDirectoryPath=sftp_remote_path,
+            )
+            transfer_id = response["TransferId"]
+            self.logger.info(f"SFTP Transfer ID: {transfer_id}")
+            self.logger.info(f"SFTP Connector ID: {connector_id}")
+            self.logger.info(f"SFTP Bucket: {s3_bucket_location}")
+            self.logger.info(f"SFTP Files: {', '.join(batch)}")
+            self.logger.info(f"SFTP Remote Path: {sftp_remote_path}")
+            self.logger.info(f"SFTP Response: {str(response)}")
+
+    def __start_file_transfer(
+        self, is_invocation_role: str, **transfer_request
+    ) -> dict:
+        """Start a file transfer, refreshing the session once if it expired"""
+        try:
+            return self.__get_transfer_client(is_invocation_role).start_file_transfer(
+                **transfer_request
+            )
+        except ClientError as exp:
+            if exp.response["Error"]["Code"] != "ExpiredTokenException":
+                raise
+            # The assumed role session expired, assume the role again and retry
+            self.logger.info("SFTP transfer session expired, refreshing credentials")
+            self._transfer_client = None
+            return self.__get_transfer_client(is_invocation_role).start_file_transfer(
+                **transfer_request
+            )
+
+    def __get_transfer_client(self, is_invocation_role: str):
+        """Get the transfer client, assuming the invocation role on first use"""
+        if self._transfer_client is None:
+            session = config_utils.assume_role(
+                is_invocation_role, f"{self.context.tenant_code}-sftp-transfer-session"
+            )
+            self._transfer_client = session.client(service_name="transfer")
+        return self._transfer_client
@@ -1,10 +1,13 @@
 """Transforms PKH application objects to CMS application data file"""
 
 from datetime import datetime
+from functools import lru_cache
 import json
 import re
 from typing import Optional
 
+import numpy as np
+import orjson
 import pandas as pd
 
 from ...dataframe.dataframe_loader import DataframeLoader
@@ -14,20 +17,67 @@ from ...utils import config_utils
 from ..base_transformer import TransformationResponse
 from .config import UNIVERSITY_CMS_TRANSFORMATION_CONFIG
 
-
-def extract_school_code(json_str: str, index: int) -> str | None:
-    if not json_str:  # Check for empty/None json_str
-        return None
+NON_DIGIT_RE = re.compile(r"\D")
+
+YES_NO_VALUES = {
+    "TRUE": "Yes",
+    "True": "Yes",
+    "true": "Yes",
+    True: "Yes",
+    "FALSE": "No",
+    "False": "No",
+    "false": "No",
+    False: "No",
+}
+
+MAX_EDUCATION_HISTORY = 9
+# (education history record field, output column prefix) in output column order
+EDUCATION_HISTORY_COLUMNS = [
+    ("schoolCode", "applicationEducationHistoryRecords_schoolCode"),
+    (
+        "educationInstitutionName",
+        "applicationEducationHistoryRecords_educationInstitutionName",
+    ),
+    ("monthEntered", "Month_Entered"),
+    ("yearEntered", "Year_Entered"),
+    ("monthDeparted", "Month_Departed"),
+    ("yearDeparted", "Year_Departed"),
+    (
+        "degreeEarnedBeforeEnrolling",
+        "applicationEducationHistory_degreeEarnedBeforeEnrolling",
+    ),
+    ("degreeEarned", "applicationEducationHistory_degreeEarned"),
+    ("major", "applicationEducationHistoryRecords_major"),
+]
+
+
+@lru_cache(maxsize=4096)
+def load_json_cached(json_str: str):
+    """Parse a JSON string, reusing the result for repeated identical strings
+
+    Many applications carry identical payloads (e.g. empty arrays), so those
+    are only decoded once. Callers must not mutate the returned objects.
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+    catching the stdlib exception.
+    """
+    return orjson.loads(json_str)
+
+
+def load_json_list(json_str: str) -> list:
+    """Parse a JSON array column value, treating empty or invalid values as []"""
+    # Missing values may be None, NaN or pd.NA depending on the column dtype
+    if not isinstance(json_str, str) or not json_str:
+        return []
     try:
-        parsed = json.loads(json_str)
-        if index < len(parsed):
-            school_code = parsed[index].get("schoolCode")
-            # Ensure school_code is not None before str() and slicing
-            return str(school_code)[-4:] if school_code is not None else None
-        return None
+        return load_json_cached(json_str)
     except json.JSONDecodeError:
-        # Consider if logging is needed/possible here
-        return None
+        return []
+
+
+def split_year_month(date: str) -> tuple[str, str]:
+    """Split a YYYY-MM-DD date string into its (year, month) parts"""
+    year, month = date.split("-", 2)[:2]
+    return year, month
 
 
 class UniversityCMSApplicationTransformer(EgressBaseDataTransformer):
@@ -48,20 +98,32 @@ class UniversityCMSApplicationTransformer(EgressBaseDataTransformer):
             self.dataframe = pd.DataFrame()
             return
 
-        dataframe = application_dataframe.merge(
-            applicant_dataframe,
+        # Only bring over the applicant time and the applicant columns the
+        # application does not already have, the remaining duplicates were
+        # only ever merged in as unused *_applicant columns
+        applicant_columns = ["applicantId", "time"] + [
+            column
+            for column in applicant_dataframe.columns
+            if column not in application_dataframe.columns
+        ]
+        # Filter before merging so only submitted applications are joined
+        submitted_applications = application_dataframe[
+            application_dataframe["applicationStatus"] == "Submitted"
+        ]
+        dataframe = submitted_applications.merge(
+            applicant_dataframe[applicant_columns].rename(
+                columns={"time": "time_applicant"}
+            ),
             on="applicantId",
             how="left",
-            suffixes=("", "_applicant"),
         )
-        dataframe = dataframe[dataframe.get("applicationStatus") == "Submitted"]
         dataframe["time_application"] = dataframe["time"]
-        dataframe["time"] = dataframe.apply(
-            lambda row: max(
-                pd.to_datetime(row["time_application"], utc=True),
-                pd.to_datetime(row["time_applicant"], utc=True),
-            ),
-            axis=1,
+        # Latest of the application and applicant times. Like max(), the
+        # application time is kept when the applicant time is missing
+        time_application = pd.to_datetime(dataframe["time_application"], utc=True)
+        time_applicant = pd.to_datetime(dataframe["time_applicant"], utc=True)
+        dataframe["time"] = time_application.mask(
+            time_applicant > time_application, time_applicant
         )
 
         self.dataframe = self.dataframe_loader.filter_dataframe(dataframe)
@@ -74,27 +136,37 @@ class UniversityCMSApplicationTransformer(EgressBaseDataTransformer):
         if len(self.dataframe) == 0:
             self.logger.info("No data to transform")
             return TransformationResponse(self.dataframe, [], 0)
-        transformed_dataframe = self.__passthrough()
+        passthrough_columns = self.__passthrough()
         custom_columns = self.__custom_transforms()
-        address_columns = self.__transform_addresses()
-        education_columns = self.__transform_education_history()
+        # Release the parsed payloads, they are not needed after the transform
+        load_json_cached.cache_clear()
 
-        transformed_dataframe = pd.concat(
-            [transformed_dataframe, custom_columns, address_columns, education_columns],
-            axis=1,
-            join="inner",
+        # Every column is built on self.dataframe's index, so the output is
+        # assembled in one constructor call instead of an aligning concat
+        transformed_dataframe = pd.DataFrame(
+            {
+                **passthrough_columns.to_dict(orient="series"),
+                **custom_columns,
+            },
+            index=self.dataframe.index,
         )
         if len(transformed_dataframe.index) == 0:
             self.logger.info("No data to transform")
             return TransformationResponse(
                 transformed_dataframe, [], len(transformed_dataframe)
             )
-        transformed_dataframe.replace(
-            ["TRUE", "True", "true", True], "Yes", inplace=True
-        )
-        transformed_dataframe.replace(
-            ["FALSE", "False", "false", False], "No", inplace=True
-        )
+        # Only text columns can hold the stringly booleans; real bool columns
+        # are mapped directly and everything else is left alone
+        text_columns = transformed_dataframe.select_dtypes(
+            include=["object", "string"]
+        ).columns
+        transformed_dataframe[text_columns] = transformed_dataframe[
+            text_columns
+        ].replace(YES_NO_VALUES)
+        for column in transformed_dataframe.select_dtypes(include="bool").columns:
+            transformed_dataframe[column] = (
+                transformed_dataframe[column].map(YES_NO_VALUES).astype("category")
+            )
         self.logger.info(
             f"Number of completed application transforms: {len(transformed_dataframe.index)}"
         )
@@ -116,8 +188,10 @@ class UniversityCMSApplicationTransformer(EgressBaseDataTransformer):
         filename = f"application-{timestamp}.csv"
         self.logger.info(f"Publishing file to curated bucket: {filename}")
         integration_account_staging_bucket = f"{self.context.env_name}-admissions-gateway-university-sftp-egress-{self.transformation_context.is_account_number}"
+        # Serialize once, the same file goes to both buckets
+        csv_payload = transformed_dataframe.to_csv(index=False)
         (success, message) = config_utils.upload_to_s3_v2(
-            transformed_dataframe.to_csv(index=False),
+            csv_payload,
             filename,
             f"{self.context.env_name}-university-cms-curated-data-{self.transformation_context.ds_account_number}",
             "university-cms",
@@ -128,206 +202,167 @@ class UniversityCMSApplicationTransformer(EgressBaseDataTransformer):
             self.logger.error(message)
         self.logger.info(f"Publishing file to staging bucket: {filename}")
         (success, message) = config_utils.upload_to_s3_v2(
-            transformed_dataframe.to_csv(index=False),
+            csv_payload,
             filename,
             integration_account_staging_bucket,
         )
         if success:
             self.logger.info(message)
-            self.send_to_sftp_server(filename, integration_account_staging_bucket)
+            self.send_to_sftp_server([filename], integration_account_staging_bucket)
         else:
             self.logger.error(message)
 
     def __passthrough(self) -> pd.DataFrame:
         """copy the fields with no transforms in UNIVERSITY_CMS_TRANSFORMATION_CONFIG"""
-        return pd.DataFrame(
-            {
-                column: self.dataframe.get(column, None)
-                for column in UNIVERSITY_CMS_TRANSFORMATION_CONFIG.get("passthrough")
-            }
+        return self.dataframe.reindex(
+            columns=UNIVERSITY_CMS_TRANSFORMATION_CONFIG.get("passthrough")
         )
 
-    def __custom_transforms(self):
-        """custom transformations for fields"""
-        return pd.DataFrame(
-            {
-                "campuscode_online": "Online",
-                "phones_phoneNumber": self.dataframe.get("phones", pd.Series()).apply(
-                    self.__get_phone_number
-                ),
-                "phones_doNotText": "Yes",
-                "emails_emailAddress": self.dataframe.get("emails", pd.Series()).apply(
-                    self.__get_email
-                ),
-                "demographics_affiliation": self.dataframe.get(
-                    "demographics_affiliations", pd.Series()
-                ).apply(self.__check_affiliation),
-                "additionalQuestions_signature": self.dataframe.get(
-                    "personalData_firstName", pd.Series()
-                )
-                + " "
-                + self.dataframe.get("personalData_lastName", pd.Series()),
-                "payment_waived": "Waived",
-                # below are passthroughs, but header name is changed due to locked file requirements
-                "militaryAffiliation_plannedBenefits": self.dataframe.get(
-                    "militaryAffiliation_educationBenefit", pd.Series()
-                ),
-                "startTerm": self.dataframe.get(
-                    "academicPlan_enrollmentTerm", pd.Series()
-                ),
-                "additionalQuestions_Disciplinary_Notification_Statement__c'": self.dataframe.get(
-                    "additionalQuestions_disciplinaryNotificationStatementConfirmation",
-                    pd.Series(),
-                ),
-            }
-        )
+    def __custom_transforms(self) -> dict:
+        """custom transformations for fields, including phones, emails, addresses
+        and education history
 
-    def __transform_addresses(self):
-        """transform addresses"""
-        return pd.DataFrame(
-            {
-                "Permanent address": self.dataframe.get("addresses", pd.Series()).apply(
-                    self.__get_permanent_address
-                ),
-                "Permanent address - City": self.dataframe.get(
-                    "addresses", pd.Series()
-                ).apply(lambda x: self.__get_permanent_address_field(x, "city")),
-                "Permanent address - State": self.dataframe.get(
-                    "addresses", pd.Series()
-                ).apply(lambda x: self.__get_permanent_address_field(x, "stateCode")),
-                "Permanent address - Zip": self.dataframe.get(
-                    "addresses", pd.Series()
-                ).apply(lambda x: self.__get_permanent_address_field(x, "zipCode")),
-                "Permanent address - Country": self.dataframe.get(
-                    "addresses", pd.Series()
-                ).apply(lambda x: self.__get_permanent_address_field(x, "country")),
-                "Alternate address available": self.dataframe.get(
-                    "receiveMailAtDifferentAddress", pd.Series()
-                ),
-                "Current address - Address": self.dataframe.apply(
-                    lambda row: self.__get_current_address(
-                        row["addresses"], row["receiveMailAtDifferentAddress"]
-                    ),
-                    axis=1,
-                ),
-                "Current address - City": self.dataframe.apply(
-                    lambda row: self.__get_current_address_field(
-                        row["addresses"], "city", row["receiveMailAtDifferentAddress"]
-                    ),
-                    axis=1,
-                ),
-                "Current address - State": self.dataframe.apply(
-                    lambda row: self.__get_current_address_field(
-                        row["addresses"],
-                        "stateCode",
-                        row["receiveMailAtDifferentAddress"],
-                    ),
-                    axis=1,
-                ),
-                "Current address - Zip": self.dataframe.apply(
-                    lambda row: self.__get_current_address_field(
-                        row["addresses"],
-                        "zipCode",
-                        row["receiveMailAtDifferentAddress"],
-                    ),
-                    axis=1,
-                ),
-                "Current address - Country": self.dataframe.apply(
-                    lambda row: self.__get_current_address_field(
-                        row["addresses"],
-                        "country",
-                        row["receiveMailAtDifferentAddress"],
-                    ),
-                    axis=1,
-                ),
-                "Alternate address from date": self.dataframe.apply(
-                    lambda row: self.__get_current_address_field(
-                        row["addresses"],
-                        "addressEffectiveDate",
-                        row["receiveMailAtDifferentAddress"],
-                    ),
-                    axis=1,
-                ),
-                "Alternate address to date": self.dataframe.apply(
-                    lambda row: self.__get_current_address_field(
-                        row["addresses"],
-                        "addressExpirationDate",
-                        row["receiveMailAtDifferentAddress"],
-                    ),
-                    axis=1,
-                ),
-            }
-        )
+        Every JSON column is parsed once and all derived fields are filled in
+        a single pass over the rows.
+        """
+        columns = set(self.dataframe.columns)
+        empty_column = pd.Series(None, index=self.dataframe.index, dtype=object)
 
-    def __transform_education_history(self):
-        """transform education history"""
-        education_columns = pd.DataFrame()
-
-        MAX_EDU_HIST = 9
-        for index in range(MAX_EDU_HIST):
-            education_columns[
-                f"applicationEducationHistoryRecords_schoolCode{index + 1}"
-            ] = self.dataframe.get(
-                "applicationEducationHistoryRecords", pd.Series()
-            ).apply(lambda x: extract_school_code(x, index))
-            education_columns[
-                f"applicationEducationHistoryRecords_educationInstitutionName{index + 1}"
-            ] = self.dataframe.get(
-                "applicationEducationHistoryRecords", pd.Series()
-            ).apply(
-                lambda x: (
-                    json.loads(x)[index].get("educationInstitutionName")
-                    if index < len(json.loads(x))
-                    else None
-                )
+        def column(column_name: str) -> pd.Series:
+            return (
+                self.dataframe[column_name] if column_name in columns else empty_column
+            )
+
+        phone_numbers = []
+        email_addresses = []
+        affiliations = []
+        home_addresses = []
+        other_addresses = []
+        # One (rows x MAX_EDUCATION_HISTORY) array per education history field
+        education_fields = {
+            field_name: np.full(
+                (len(self.dataframe.index), MAX_EDUCATION_HISTORY), None, dtype=object
+            )
+            for field_name, _ in EDUCATION_HISTORY_COLUMNS
+        }
+        for row, (
+            phones,
+            emails,
+            affiliation_list,
+            addresses,
+            has_different_mailing_address,
+            education_history,
+        ) in enumerate(
+            zip(
+                column("phones"),
+                column("emails"),
+                column("demographics_affiliations"),
+                column("addresses"),
+                column("receiveMailAtDifferentAddress"),
+                column("applicationEducationHistoryRecords"),
             )
-            education_columns[f"Month_Entered{index + 1}"] = self.dataframe.get(
-                "applicationEducationHistoryRecords", pd.Series()
-            ).apply(lambda x: self.__get_month_entered(x, index))
-            education_columns[f"Year_Entered{index + 1}"] = self.dataframe.get(
-                "applicationEducationHistoryRecords", pd.Series()
-            ).apply(lambda x: self.__get_year_entered(x, index))
-            education_columns[f"Month_Departed{index + 1}"] = self.dataframe.get(
-                "applicationEducationHistoryRecords", pd.Series()
-            ).apply(lambda x: self.__get_month_departed(x, index))
-            education_columns[f"Year_Departed{index + 1}"] = self.dataframe.get(
-                "applicationEducationHistoryRecords", pd.Series()
-            ).apply(lambda x: self.__get_year_departed(x, index))
-            education_columns[
-                f"applicationEducationHistory_degreeEarnedBeforeEnrolling{index + 1}"
-            ] = self.dataframe.get(
-                "applicationEducationHistoryRecords", pd.Series()
-            ).apply(
-                lambda x: (
-                    json.loads(x)[index].get("degreeEarnedBeforeEnrolling")
-                    if index < len(json.loads(x))
-                    else None
-                )
+        ):
+            phone_numbers.append(self.__get_phone_number(load_json_list(phones)))
+            email_addresses.append(self.__get_email(load_json_list(emails)))
+            affiliations.append(
+                self.__check_affiliation(load_json_list(affiliation_list))
             )
-            education_columns[
-                f"applicationEducationHistory_degreeEarned{index + 1}"
-            ] = self.dataframe.get(
-                "applicationEducationHistoryRecords", pd.Series()
-            ).apply(
-                lambda x: (
-                    json.loads(x)[index].get("degreeEarned")
-                    if index < len(json.loads(x))
-                    else None
-                )
+            address_list = load_json_list(addresses)
+            home_addresses.append(self.__find_address(address_list, "HOME"))
+            other_addresses.append(
+                self.__find_address(address_list, "OTHER")
+                if has_different_mailing_address == "YES"
+                else None
             )
-            education_columns[
-                f"applicationEducationHistoryRecords_major{index + 1}"
-            ] = self.dataframe.get(
-                "applicationEducationHistoryRecords", pd.Series()
-            ).apply(
-                lambda x: (
-                    json.loads(x)[index].get("major")
-                    if index < len(json.loads(x))
-                    else None
-                )
+            self.__fill_education_history(
+                education_fields, row, load_json_list(education_history)
             )
 
-        return education_columns
+        def field(address_records, field_name):
+            return [
+                address.get(field_name) if address else None
+                for address in address_records
+            ]
+
+        return {
+            "campuscode_online": "Online",
+            "phones_phoneNumber": phone_numbers,
+            "phones_doNotText": "Yes",
+            "emails_emailAddress": email_addresses,
+            "demographics_affiliation": affiliations,
+            "additionalQuestions_signature": (
+                self.dataframe["personalData_firstName"]
+                + " "
+                + self.dataframe["personalData_lastName"]
+                if {"personalData_firstName", "personalData_lastName"} <= columns
+                else empty_column
+            ),
+            "payment_waived": "Waived",
+            # below are passthroughs, but header name is changed due to locked file requirements
+            "militaryAffiliation_plannedBenefits": column(
+                "militaryAffiliation_educationBenefit"
+            ),
+            "startTerm": column("academicPlan_enrollmentTerm"),
+            "additionalQuestions_Disciplinary_Notification_Statement__c'": column(
+                "additionalQuestions_disciplinaryNotificationStatementConfirmation"
+            ),
+            "Permanent address": [
+                self.__format_address_line(address) for address in home_addresses
+            ],
+            "Permanent address - City": field(home_addresses, "city"),
+            "Permanent address - State": field(home_addresses, "stateCode"),
+            "Permanent address - Zip": field(home_addresses, "zipCode"),
+            "Permanent address - Country": field(home_addresses, "country"),
+            "Alternate address available": column("receiveMailAtDifferentAddress"),
+            "Current address - Address": [
+                self.__format_address_line(address) for address in other_addresses
+            ],
+            "Current address - City": field(other_addresses, "city"),
+            "Current address - State": field(other_addresses, "stateCode"),
+            "Current address - Zip": field(other_addresses, "zipCode"),
+            "Current address - Country": field(other_addresses, "country"),
+            "Alternate address from date": field(
+                other_addresses, "addressEffectiveDate"
+            ),
+            "Alternate address to date": field(
+                other_addresses, "addressExpirationDate"
+            ),
+            **self.__education_history_columns(education_fields),
+        }
+
+    def __fill_education_history(
+        self, education_fields: dict, row: int, education_history: list
+    ) -> None:
+        """fill one row of the education history field arrays"""
+        for index, record in enumerate(education_history[:MAX_EDUCATION_HISTORY]):
+            code = record.get("schoolCode")
+            if code is not None:
+                education_fields["schoolCode"][row, index] = str(code)[-4:]
+            education_fields["educationInstitutionName"][row, index] = record.get(
+                "educationInstitutionName"
+            )
+            start_date = record.get("hedStartDate")
+            if start_date:
+                (
+                    education_fields["yearEntered"][row, index],
+                    education_fields["monthEntered"][row, index],
+                ) = split_year_month(start_date)
+            end_date = record.get("hedEndDate")
+            if end_date:
+                (
+                    education_fields["yearDeparted"][row, index],
+                    education_fields["monthDeparted"][row, index],
+                ) = split_year_month(end_date)
+            for field_name in ("degreeEarnedBeforeEnrolling", "degreeEarned", "major"):
+                education_fields[field_name][row, index] = record.get(field_name)
+
+    def __education_history_columns(self, education_fields: dict) -> dict:
+        """slice the education history field arrays into one column per index"""
+        return {
+            f"{column_prefix}{index + 1}": education_fields[field_name][:, index]
+            for index in range(MAX_EDUCATION_HISTORY)
+            for field_name, column_prefix in EDUCATION_HISTORY_COLUMNS
+        }
 
     def __format_phone_number(self, raw: str) -> Optional[str]:
         """
@@ -339,7 +374,7 @@ class UniversityCMSApplicationTransformer(EgressBaseDataTransformer):
         """
         if not raw:
             return None
-        digits = re.sub(r"\D", "", raw)
+        digits = NON_DIGIT_RE.sub("", raw)
         # Strip country code “1”
         if len(digits) == 11 and digits.startswith("1"):
             digits = digits[1:]
@@ -348,103 +383,35 @@ class UniversityCMSApplicationTransformer(EgressBaseDataTransformer):
         # Unexpected format: return as-is (or return digits if you prefer)
         return raw
 
-    def __get_phone_number(self, phones_list: str) -> str:
+    def __get_phone_number(self, phones: list) -> str:
         """
         Extract the first MOBILE phone and format it.
         """
-        if phones_list:
-            try:
-                phones_json_list = json.loads(phones_list)
-                for phone in phones_json_list:
-                    if phone.get("phoneType") == "MOBILE":
-                        return self.__format_phone_number(phone.get("phoneNumber", ""))
-            except json.JSONDecodeError:
-                # self.logger.warning(f"Could not decode phones_list: {phones_list}")
-                return None
+        for phone in phones:
+            if phone.get("phoneType") == "MOBILE":
+                return self.__format_phone_number(phone.get("phoneNumber", ""))
         return None
 
-    def __get_email(self, emails_list: str):
-        if emails_list:
-            for email in json.loads(emails_list):
-                if email["emailType"] == "HOME":
-                    return email["emailAddress"]
+    def __get_email(self, emails: list):
+        for email in emails:
+            if email["emailType"] == "HOME":
+                return email["emailAddress"]
         return None
 
-    def __check_affiliation(self, affiliations_list: str):
-        if affiliations_list:
-            for affiliation in json.loads(affiliations_list):
-                if affiliation in ["Phi Theta Kappa"]:
-                    return True
+    def __check_affiliation(self, affiliations: list):
+        for affiliation in affiliations:
+            if affiliation in ["Phi Theta Kappa"]:
+                return True
         return False
 
-    def __get_permanent_address(self, addresses_list: str):
-        if addresses_list:
-            for address in json.loads(addresses_list):
-                if address["addressType"] == "HOME":
-                    return address.get("line1", "") + " " + address.get("line2", "")
-        return None
-
-    def __get_permanent_address_field(self, addresses_list: str, field_name):
-        if addresses_list:
-            for address in json.loads(addresses_list):
-                if address["addressType"] == "HOME":
-                    return address.get(field_name)
-        return None
-
-    def __get_current_address(
-        self, addresses_list: str, hasDifferentMailingAddress: str
-    ):
-        if hasDifferentMailingAddress == "YES" and addresses_list:
-            for address in json.loads(addresses_list):
-                if address["addressType"] == "OTHER":
-                    return address.get("line1", "") + " " + address.get("line2", "")
-        return None
-
-    def __get_current_address_field(
-        self, addresses_list: str, field_name, hasDifferentMailingAddress: str
-    ):
-        if hasDifferentMailingAddress == "YES" and addresses_list:
-            for address in json.loads(addresses_list):
-                if address["addressType"] == "OTHER":
-                    return address.get(field_name)
-        return None
-
-    def __get_month_entered(self, application_education_histories: str, index):
-        if application_education_histories:
-            if index < len(json.loads(application_education_histories)):
-                start_date = json.loads(application_education_histories)[index].get(
-                    "hedStartDate"
-                )
-                if start_date:
-                    return start_date.split("-")[1]
-        return None
-
-    def __get_year_entered(self, application_education_histories: str, index):
-        if application_education_histories:
-            if index < len(json.loads(application_education_histories)):
-                start_date = json.loads(application_education_histories)[index].get(
-                    "hedStartDate"
-                )
-                if start_date:
-                    return start_date.split("-")[0]
-        return None
-
-    def __get_month_departed(self, application_education_histories: str, index):
-        if application_education_histories:
-            if index < len(json.loads(application_education_histories)):
-                end_date = json.loads(application_education_histories)[index].get(
-                    "hedEndDate"
-                )
-                if end_date:
-                    return end_date.split("-")[1]
+    def __find_address(self, addresses: list, address_type: str) -> Optional[dict]:
+        """Return the first address of the given type"""
+        for address in addresses:
+            if address["addressType"] == address_type:
+                return address
         return None
 
-    def __get_year_departed(self, application_education_histories: str, index):
-        if application_education_histories:
-            if index < len(json.loads(application_education_histories)):
-                end_date = json.loads(application_education_histories)[index].get(
-                    "hedEndDate"
-                )
-                if end_date:
-                    return end_date.split("-")[0]
+    def __format_address_line(self, address: Optional[dict]) -> Optional[str]:
+        if address:
+            return address.get("line1", "") + " " + address.get("line2", "")
         return None